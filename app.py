@@ -8,51 +8,124 @@ Run: python3 app.py
 Visit: http://localhost:5000
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 import requests
+from requests.adapters import HTTPAdapter
+import functools
 import json
+import os
+import time
+
+# orjson serializes API payloads ~3-5x faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson parses the /api/tags response incrementally, skipping the
+# fields we never look at
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 app = Flask(__name__)
 
+# Templates never change at runtime: skip per-request mtime checks and
+# compile every page template once at startup so even the first hit to
+# each page serves at steady-state latency
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_env.auto_reload = False
+for _template in ("index.html", "streaming.html", "chat.html",
+                  "prompting.html", "advanced.html"):
+    app.jinja_env.get_template(_template)
+
 # Configuration
 OLLAMA_API = "http://localhost:11434/api/generate"
 MODELS_API = "http://localhost:11434/api/tags"
 DEFAULT_MODEL = "neural-chat"
+INV_GB = 1.0 / (1024 ** 3)  # bytes -> GB, multiply instead of divide
+
+# Shared session so repeated calls reuse pooled keep-alive sockets
+# instead of opening a fresh TCP connection per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0))
+
+
+# Cached model list so every page load doesn't round-trip to Ollama
+_MODELS_CACHE = {"t": 0.0, "v": None}
+MODELS_CACHE_TTL = 60  # seconds
 
 
 def get_available_models():
-    """Get list of available models from Ollama."""
+    """Get list of available models from Ollama (cached for a short TTL)."""
+    if _MODELS_CACHE["v"] is not None and time.monotonic() - _MODELS_CACHE["t"] < MODELS_CACHE_TTL:
+        return _MODELS_CACHE["v"]
+
     try:
-        response = requests.get(MODELS_API)
-        models = response.json().get("models", [])
-        return [model["name"] for model in models]
+        if ijson is not None:
+            # Pull just the model names out of the response stream
+            response = SESSION.get(MODELS_API, timeout=2, stream=True)
+            names = list(ijson.items(response.raw, "models.item.name"))
+        else:
+            response = SESSION.get(MODELS_API, timeout=2)
+            names = [model["name"] for model in response.json().get("models", [])]
     except Exception as e:
         return [DEFAULT_MODEL]
 
+    _MODELS_CACHE["v"] = names
+    _MODELS_CACHE["t"] = time.monotonic()
+    return names
 
-def query_ollama(prompt, model=DEFAULT_MODEL, temperature=0.7, stream=False):
-    """Query Ollama with given prompt and parameters."""
-    payload = {
+
+# Only cache near-deterministic generations; higher temperatures are
+# expected to vary between calls
+MAX_CACHE_TEMPERATURE = 0.3
+
+
+@functools.lru_cache(maxsize=1024)
+def _query_cached(model, prompt, temperature):
+    """Run a non-streaming generation; successful results are memoized."""
+    response = SESSION.post(OLLAMA_API, json={
         "model": model,
         "prompt": prompt,
-        "stream": stream,
+        "stream": False,
         "temperature": temperature,
-    }
-    
+    }, timeout=60)
+    response.raise_for_status()
+    result = response.json()
+    return (
+        result.get("response", ""),
+        result.get("eval_count", 0),
+        result.get("total_duration", 0),
+    )
+
+
+def query_ollama(prompt, model=DEFAULT_MODEL, temperature=0.7, stream=False, cache=True):
+    """Query Ollama with given prompt and parameters."""
     try:
-        response = requests.post(OLLAMA_API, json=payload, timeout=60)
-        response.raise_for_status()
-        
         if stream:
+            response = SESSION.post(OLLAMA_API, json={
+                "model": model,
+                "prompt": prompt,
+                "stream": True,
+                "temperature": temperature,
+            }, timeout=60, stream=True)
+            response.raise_for_status()
             return response
+
+        if cache and temperature <= MAX_CACHE_TEMPERATURE:
+            # Repeat prompts at low temperature skip the LLM call entirely
+            text, tokens, duration = _query_cached(model, prompt, temperature)
         else:
-            result = response.json()
-            return {
-                "response": result.get("response", ""),
-                "tokens": result.get("eval_count", 0),
-                "duration": result.get("total_duration", 0) / 1e9,
-                "status": "success"
-            }
+            text, tokens, duration = _query_cached.__wrapped__(model, prompt, temperature)
+
+        return {
+            "response": text,
+            "tokens": tokens,
+            "duration": duration / 1e9,
+            "status": "success"
+        }
     except requests.exceptions.ConnectionError:
         return {
             "response": "❌ Error: Cannot connect to Ollama API. Make sure to run 'ollama serve'",
@@ -63,13 +136,23 @@ def query_ollama(prompt, model=DEFAULT_MODEL, temperature=0.7, stream=False):
             "response": "❌ Error: Request timed out. Try a simpler prompt.",
             "status": "error"
         }
-    except Exception as e:
+    except requests.exceptions.RequestException as e:
+        # Only HTTP-level failures; genuine bugs propagate to Flask
         return {
             "response": f"❌ Error: {str(e)}",
             "status": "error"
         }
 
 
+def json_response(data, status=200):
+    """Build a JSON response with orjson when available."""
+    if orjson is not None:
+        body = orjson.dumps(data)
+    else:
+        body = json.dumps(data)
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
 @app.route("/")
 def index():
     """Home page - Basic Request example."""
@@ -119,45 +202,101 @@ def api_generate():
         return jsonify({"error": "No prompt provided"}), 400
     
     result = query_ollama(prompt, model, temperature, stream=False)
-    response = jsonify(result)
-    response.headers['Content-Type'] = 'application/json; charset=utf-8'
-    return response
+    return json_response(result)
+
+
+@app.route("/api/stream", methods=["POST"])
+def api_stream():
+    """Stream a generation to the browser as Server-Sent Events."""
+    data = request.json
+    prompt = data.get("prompt", "")
+    model = data.get("model", DEFAULT_MODEL)
+    temperature = float(data.get("temperature", 0.7))
+
+    if not prompt:
+        return json_response({"error": "No prompt provided"}, status=400)
+
+    upstream = query_ollama(prompt, model, temperature, stream=True)
+    if isinstance(upstream, dict):
+        # Connection/timeout error from query_ollama
+        return json_response(upstream, status=502)
+
+    def pump():
+        # Forward Ollama's NDJSON frames as SSE events as they arrive
+        buf = bytearray()
+        for chunk in upstream.iter_content(chunk_size=1024, decode_unicode=False):
+            buf += chunk
+            while True:
+                newline = buf.find(b"\n")
+                if newline < 0:
+                    break
+                line = bytes(buf[:newline])
+                del buf[:newline + 1]
+                if line:
+                    yield f"data: {line.decode()}\n\n"
+        if buf:
+            yield f"data: {bytes(buf).decode()}\n\n"
+
+    return Response(stream_with_context(pump()), mimetype="text/event-stream")
 
 
 @app.route("/api/models", methods=["GET"])
 def api_models():
     """Get list of available models."""
     try:
-        response = requests.get(MODELS_API)
-        models = response.json().get("models", [])
-        return jsonify({
+        if ijson is not None:
+            response = SESSION.get(MODELS_API, stream=True)
+            models = ijson.items(response.raw, "models.item")
+        else:
+            response = SESSION.get(MODELS_API)
+            models = response.json().get("models", [])
+        return json_response({
             "models": [{
                 "name": m["name"],
-                "size": m.get("size", 0) / (1024**3)  # Convert to GB
+                "size": m.get("size", 0) * INV_GB  # Convert to GB
             } for m in models],
             "status": "success"
         })
     except Exception as e:
-        return jsonify({"error": str(e), "status": "error"}), 500
+        return json_response({"error": str(e), "status": "error"}, status=500)
+
+
+@app.route("/api/models/invalidate", methods=["POST"])
+def api_models_invalidate():
+    """Flush the cached model list (e.g. after 'ollama pull')."""
+    _MODELS_CACHE["v"] = None
+    _MODELS_CACHE["t"] = 0.0
+    return jsonify({"status": "success", "message": "Model cache cleared"})
+
+
+# Cached health probe so frequent status polls don't each pay a round-trip
+_STATUS = {"t": 0.0, "ok": None}
+STATUS_CACHE_TTL = 2.0  # seconds
 
 
 @app.route("/api/status", methods=["GET"])
 def api_status():
-    """Check Ollama server status."""
-    try:
-        response = requests.get(MODELS_API)
-        response.raise_for_status()
-        return jsonify({
+    """Check Ollama server status (result cached for a couple of seconds)."""
+    if _STATUS["ok"] is None or time.monotonic() - _STATUS["t"] >= STATUS_CACHE_TTL:
+        try:
+            response = SESSION.head(MODELS_API, timeout=0.5)
+            response.raise_for_status()
+            _STATUS["ok"] = True
+        except Exception as e:
+            _STATUS["ok"] = False
+        _STATUS["t"] = time.monotonic()
+
+    if _STATUS["ok"]:
+        return json_response({
             "status": "online",
             "server": "Ollama is running",
             "version": "1.0"
         })
-    except Exception as e:
-        return jsonify({
-            "status": "offline",
-            "error": "Cannot connect to Ollama server",
-            "help": "Run 'ollama serve' in another terminal"
-        }), 503
+    return json_response({
+        "status": "offline",
+        "error": "Cannot connect to Ollama server",
+        "help": "Run 'ollama serve' in another terminal"
+    }, status=503)
 
 
 if __name__ == "__main__":
@@ -173,5 +312,16 @@ if __name__ == "__main__":
     print("   • Advanced: /advanced")
     print("\n⚠️  Make sure Ollama server is running: ollama serve")
     print("="*60 + "\n")
-    
-    app.run(debug=True, host="0.0.0.0", port=5001)
+
+    try:
+        # Production WSGI server: serves streaming responses and API calls
+        # concurrently instead of Werkzeug's single-threaded dev server
+        from waitress import serve
+        serve(app, host="0.0.0.0", port=5001, threads=16)
+    except ImportError:
+        print("Note: waitress not installed. Using Flask dev server.")
+        print("   For concurrent streaming run: pip install waitress\n")
+        # Debugger + reloader are opt-in: they add per-request overhead
+        # and a second watcher process
+        app.run(debug=os.getenv("OLLAMA_DEBUG") == "1", use_reloader=False,
+                host="0.0.0.0", port=5001, threaded=True)
@@ -11,38 +11,38 @@ Prerequisites:
 
 import requests
 import json
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 OLLAMA_API = "http://localhost:11434/api/generate"
 MODEL = "neural-chat"  # You can also try: mistral, llama3.2, etc.
 
+# Shared session keeps the connection to Ollama alive between requests
+SESSION = requests.Session()
+
+# Banner decorations built once at import instead of on every print
+BANNER_BAR = "  " + "█" * 66
+BANNER_SEP = "  █" + " " * 64 + "█"
+ARROW_SEP = "  " + "▸" * 33
+
 def format_response(text, max_width=70):
     """Format response text with proper wrapping."""
-    words = text.split()
-    lines = []
-    current_line = []
-    
-    for word in words:
-        if sum(len(w) for w in current_line) + len(current_line) + len(word) <= max_width:
-            current_line.append(word)
-        else:
-            if current_line:
-                lines.append(" ".join(current_line))
-            current_line = [word]
-    
-    if current_line:
-        lines.append(" ".join(current_line))
-    
-    return lines
+    # textwrap wraps in a single pass instead of re-measuring the
+    # current line on every word
+    return textwrap.wrap(text, width=max_width,
+                         break_long_words=False, break_on_hyphens=False)
 
 
 def print_box(lines, box_char="│", max_width=70):
     """Print text in a nicely formatted box."""
-    print("╔" + "═" * (max_width + 2) + "╗")
-    for line in lines:
-        padding = max_width - len(line)
-        print(f"{box_char} {line}{' ' * padding} {box_char}")
-    print("╚" + "═" * (max_width + 2) + "╝")
+    # Assemble the whole box and emit it with a single write instead of
+    # one print (and padding-string allocation) per line
+    top = "╔" + "═" * (max_width + 2) + "╗"
+    bottom = "╚" + "═" * (max_width + 2) + "╝"
+    body = "\n".join(f"{box_char} {line:<{max_width}} {box_char}" for line in lines)
+    sys.stdout.write(f"{top}\n{body}\n{bottom}\n")
 
 
 def simple_request(prompt):
@@ -68,7 +68,7 @@ def simple_request(prompt):
     
     try:
         # Make the request
-        response = requests.post(OLLAMA_API, json=payload)
+        response = SESSION.post(OLLAMA_API, json=payload)
         response.raise_for_status()  # Raise error if request failed
         
         # Parse the response
@@ -107,54 +107,45 @@ def main():
     
     # Header
     print("\n")
-    print("  " + "█" * 66)
-    print("  █" + " " * 64 + "█")
+    print(BANNER_BAR)
+    print(BANNER_SEP)
     print("  █" + "  🤖 OLLAMA - BASIC REQUEST EXAMPLE".center(64) + "█")
-    print("  █" + " " * 64 + "█")
-    print("  " + "█" * 66)
+    print(BANNER_SEP)
+    print(BANNER_BAR)
     
-    # Example 1: Simple question
-    print("\n  " + "▸" * 33)
-    print("  ▸ 📌 EXAMPLE 1: Simple Question")
-    print("  " + "▸" * 33)
-    prompt1 = "What is machine learning? Explain in 2-3 sentences."
-    print(f"\n  ❓ Question: {prompt1}\n")
-    response1 = simple_request(prompt1)
-    if response1:
-        print("  📝 Answer:")
-        lines1 = format_response(response1, 64)
-        print_box(lines1)
-    
-    # Example 2: Different question
-    print("\n  " + "▸" * 33)
-    print("  ▸ 📌 EXAMPLE 2: Creative Writing")
-    print("  " + "▸" * 33)
-    prompt2 = "Write a haiku about programming"
-    print(f"\n  ❓ Request: {prompt2}\n")
-    response2 = simple_request(prompt2)
-    if response2:
-        print("  🎨 Result:")
-        lines2 = format_response(response2, 64)
-        print_box(lines2)
-    
-    # Example 3: Code generation
-    print("\n  " + "▸" * 33)
-    print("  ▸ 📌 EXAMPLE 3: Code Generation")
-    print("  " + "▸" * 33)
-    prompt3 = "Write a Python function to reverse a string"
-    print(f"\n  ❓ Request: {prompt3}\n")
-    response3 = simple_request(prompt3)
-    if response3:
-        print("  💻 Code:")
-        lines3 = format_response(response3, 64)
-        print_box(lines3)
+    # The three example prompts are independent, so dispatch them in
+    # parallel — total wall time becomes the slowest request instead of
+    # the sum of all three
+    examples = [
+        ("EXAMPLE 1: Simple Question", "❓ Question", "📝 Answer:",
+         "What is machine learning? Explain in 2-3 sentences."),
+        ("EXAMPLE 2: Creative Writing", "❓ Request", "🎨 Result:",
+         "Write a haiku about programming"),
+        ("EXAMPLE 3: Code Generation", "❓ Request", "💻 Code:",
+         "Write a Python function to reverse a string"),
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(simple_request, prompt)
+                   for _, _, _, prompt in examples]
+        responses = [future.result() for future in futures]
+
+    # Render the boxes sequentially once everything has arrived
+    for (title, question_label, answer_label, prompt), response in zip(examples, responses):
+        print("\n" + ARROW_SEP)
+        print(f"  ▸ 📌 {title}")
+        print(ARROW_SEP)
+        print(f"\n  {question_label}: {prompt}\n")
+        if response:
+            print(f"  {answer_label}")
+            print_box(format_response(response, 64))
     
     # Footer
-    print("\n  " + "█" * 66)
-    print("  █" + " " * 64 + "█")
+    print("\n" + BANNER_BAR)
+    print(BANNER_SEP)
     print("  █" + "  ✅ All Examples Completed!".center(64) + "█")
-    print("  █" + " " * 64 + "█")
-    print("  " + "█" * 66)
+    print(BANNER_SEP)
+    print(BANNER_BAR)
     print()
 
 
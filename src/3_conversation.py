@@ -10,7 +10,38 @@ Prerequisites:
 """
 
 import requests
-import json
+import sys
+
+# orjson parses the per-token JSON frames ~3-5x faster than stdlib json
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+# Flush stdout every N streamed tokens instead of once per token
+FLUSH_EVERY = 8
+
+
+def iter_ndjson(response, chunk_size=4096):
+    """
+    Yield parsed JSON objects from Ollama's newline-delimited stream.
+
+    Reads raw bytes in large chunks and splits on newlines manually,
+    which avoids the per-line decoding overhead of iter_lines().
+    """
+    buf = bytearray()
+    for chunk in response.iter_content(chunk_size=chunk_size, decode_unicode=False):
+        buf += chunk
+        while True:
+            newline = buf.find(b"\n")
+            if newline < 0:
+                break
+            line = bytes(buf[:newline])
+            del buf[:newline + 1]
+            if line:
+                yield loads(line)
+    if buf:
+        yield loads(bytes(buf))
 
 
 class OllamaChatbot:
@@ -26,7 +57,15 @@ class OllamaChatbot:
         """
         self.model = model
         self.api_url = api_url
+        # Shared session keeps the connection to Ollama alive between turns
+        self.session = requests.Session()
         self.conversation_history = []
+        # Keep only the last N exchanges in the prompt so per-turn cost
+        # stays bounded instead of growing with the whole conversation
+        self.max_turns = 12
+        # Rendered transcript, appended to after each turn so build_prompt
+        # doesn't re-render the whole history every time
+        self._rendered_history = ""
         self.system_prompt = "You are a helpful assistant. Provide clear and concise answers."
     
     def set_system_prompt(self, prompt):
@@ -43,17 +82,8 @@ class OllamaChatbot:
         Returns:
             str: The complete prompt with history
         """
-        # Start with system prompt
-        full_prompt = f"System: {self.system_prompt}\n\n"
-        
-        # Add conversation history
-        for exchange in self.conversation_history:
-            full_prompt += f"User: {exchange['user']}\nAssistant: {exchange['assistant']}\n\n"
-        
-        # Add current user message
-        full_prompt += f"User: {user_message}\nAssistant:"
-        
-        return full_prompt
+        # System prompt + cached rendered history + current user message
+        return f"System: {self.system_prompt}\n\n{self._rendered_history}User: {user_message}\nAssistant:"
     
     def chat(self, user_message, stream=True):
         """
@@ -79,25 +109,28 @@ class OllamaChatbot:
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, stream=stream)
+            response = self.session.post(self.api_url, json=payload, stream=stream)
             response.raise_for_status()
             
             if stream:
-                # Collect streamed response
-                full_response = ""
+                # Collect streamed tokens in a list and join once at the
+                # end — appending to a string copies the growing prefix
+                # on every token
+                parts = []
                 print("💬 ", end="", flush=True)
-                
-                for line in response.iter_lines():
-                    if line:
-                        try:
-                            json_resp = json.loads(line)
-                            token = json_resp.get("response", "")
-                            print(token, end="", flush=True)
-                            full_response += token
-                        except json.JSONDecodeError:
-                            pass
-                
+
+                # Batch stdout flushes so we don't pay a syscall per token
+                out = sys.stdout
+                for i, json_resp in enumerate(iter_ndjson(response)):
+                    token = json_resp.get("response", "")
+                    out.write(token)
+                    if i % FLUSH_EVERY == 0:
+                        out.flush()
+                    parts.append(token)
+
+                out.flush()
                 print()  # New line after streaming
+                full_response = "".join(parts)
                 
             else:
                 # Get complete response at once
@@ -106,11 +139,21 @@ class OllamaChatbot:
                 print(f"💬 {full_response}")
             
             # Add to conversation history
+            assistant_message = full_response.strip()
             self.conversation_history.append({
                 "user": user_message,
-                "assistant": full_response.strip()
+                "assistant": assistant_message
             })
-            
+            self._rendered_history += f"User: {user_message}\nAssistant: {assistant_message}\n\n"
+
+            # Drop the oldest exchange once the window is full
+            if len(self.conversation_history) > self.max_turns:
+                self.conversation_history.pop(0)
+                self._rendered_history = "".join(
+                    f"User: {exchange['user']}\nAssistant: {exchange['assistant']}\n\n"
+                    for exchange in self.conversation_history
+                )
+
             return full_response
             
         except requests.exceptions.ConnectionError:
@@ -124,6 +167,7 @@ class OllamaChatbot:
     def clear_history(self):
         """Clear conversation history."""
         self.conversation_history = []
+        self._rendered_history = ""
         print("🗑️  Conversation history cleared")
     
     def show_history(self):
@@ -9,190 +9,197 @@ Prerequisites:
 - Run: ollama pull llama2
 """
 
+import os
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
+# orjson parses response bodies 3-10x faster than stdlib json
+try:
+    from orjson import loads as _parse
+except ImportError:
+    from json import loads as _parse
 
-def ask_model(prompt, model="llama2"):
+# Shared session so every prompt reuses pooled keep-alive connections
+# instead of paying a TCP handshake per call
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
+
+# Separator bars built once instead of per print
+BAR70 = "=" * 70
+DASH70 = "-" * 70
+
+# Match Ollama's default request-parallelism so concurrent prompts
+# don't queue up server-side
+MAX_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+
+def ask_model(prompt, model="llama2", max_chars=None, num_predict=None):
     """
     Send a prompt to Ollama and get the response.
-    
+
     Args:
         prompt (str): The prompt/question
         model (str): The model to use
-        
+        max_chars (int): Stop generating once this many characters have
+            arrived (streams and closes the connection early)
+        num_predict (int): Server-side token cap for the generation
+
     Returns:
         str: The model's response
     """
-    
+
     payload = {
         "model": model,
         "prompt": prompt,
-        "stream": False,
+        "stream": max_chars is not None,
         "temperature": 0.7
     }
-    
+    if num_predict is not None:
+        # The server stops decoding at the token cap, which is where
+        # most of an Ollama call's time goes
+        payload["options"] = {"num_predict": num_predict}
+
     try:
-        response = requests.post("http://localhost:11434/api/generate", json=payload)
-        response.raise_for_status()
-        return response.json().get("response", "")
+        if max_chars is not None:
+            # Stream and cut the generation off as soon as we have
+            # enough for the preview — the server stops decoding
+            # tokens nobody will see
+            response = _SESSION.post("http://localhost:11434/api/generate",
+                                     json=payload, stream=True)
+            response.raise_for_status()
+            parts = []
+            size = 0
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _parse(line)
+                token = chunk.get("response", "")
+                parts.append(token)
+                size += len(token)
+                if size >= max_chars or chunk.get("done", False):
+                    break
+            response.close()
+            text = "".join(parts)
+        else:
+            response = _SESSION.post("http://localhost:11434/api/generate", json=payload)
+            response.raise_for_status()
+            text = _parse(response.content).get("response", "")
     except Exception as e:
         return f"Error: {e}"
 
+    return text
+
+
+def fetch_responses(prompts, max_chars=None, num_predict=None):
+    """
+    Fetch responses for independent prompts concurrently.
+
+    Args:
+        prompts (list): Prompts to send
+        max_chars (int): Optional client-side generation cutoff
+        num_predict (int): Optional server-side token cap
+
+    Returns:
+        list: Responses in the same order as the prompts
+    """
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL) as executor:
+        return list(executor.map(
+            lambda prompt: ask_model(prompt, max_chars=max_chars,
+                                     num_predict=num_predict),
+            prompts))
+
 
-def demonstrate_technique(title, prompts, descriptions):
+def demonstrate_technique(title, prompts, descriptions, responses=None):
     """Helper function to demonstrate a technique."""
-    
-    print(f"\n{'=' * 70}")
+
+    print(f"\n{BAR70}")
     print(f"🎯 {title}")
-    print(f"{'=' * 70}\n")
-    
-    for i, (description, prompt) in enumerate(zip(descriptions, prompts), 1):
+    print(f"{BAR70}\n")
+
+    # The approaches are independent, so fetch them concurrently and
+    # print in order afterwards; only ~300 chars are shown, so cap
+    # generation there too
+    if responses is None:
+        # ~80 tokens is roughly the 300 characters we display
+        responses = fetch_responses(prompts, max_chars=300, num_predict=80)
+
+    for i, (description, prompt, response) in enumerate(
+            zip(descriptions, prompts, responses), 1):
         print(f"--- Approach {i}: {description} ---")
         print(f"Prompt: {prompt}")
-        print("-" * 70)
-        
-        response = ask_model(prompt)
-        
+        print(DASH70)
+
         # Show first 300 characters
         preview = response[:300] + "..." if len(response) > 300 else response
         print(f"Response:\n{preview}\n")
 
 
-def technique_1_specificity():
-    """Technique 1: Being Specific vs. Vague"""
-    
-    demonstrate_technique(
-        "TECHNIQUE 1: SPECIFICITY",
-        [
-            "Tell me about Python",
-            "Write a Python function to calculate the factorial of a number. Include comments explaining each step."
-        ],
-        [
-            "Vague - Generic answer",
-            "Specific - Detailed, actionable answer"
-        ]
-    )
-
-
-def technique_2_role_playing():
-    """Technique 2: Role-Playing / Context Setting"""
-    
-    demonstrate_technique(
-        "TECHNIQUE 2: ROLE-PLAYING",
-        [
-            "Explain quantum computing",
-            "You are a physics professor. Explain quantum computing to a high school student using everyday analogies."
-        ],
-        [
-            "No context - Technical explanation",
-            "With role-playing - Tailored to audience"
-        ]
-    )
-
-
-def technique_3_examples():
-    """Technique 3: Provide Examples"""
-    
-    demonstrate_technique(
-        "TECHNIQUE 3: PROVIDE EXAMPLES",
-        [
-            "How do I use list comprehensions in Python?",
-            "How do I use list comprehensions in Python? Here's an example: squares = [x**2 for x in range(5)]. Can you give me 2 more practical examples?"
-        ],
-        [
-            "Generic explanation",
-            "With examples - More concrete and helpful"
-        ]
-    )
-
-
-def technique_4_step_by_step():
-    """Technique 4: Step-by-Step Thinking"""
-    
-    demonstrate_technique(
-        "TECHNIQUE 4: STEP-BY-STEP",
-        [
-            "Is the sum of the angles in a triangle always 180 degrees?",
-            "Let me think through this step by step. In a triangle, we have three angles. What geometric principles determine the total angle measure? Can you walk me through the proof that they sum to 180 degrees?"
-        ],
-        [
-            "Simple yes/no",
-            "Step-by-step reasoning"
-        ]
-    )
-
-
-def technique_5_output_format():
-    """Technique 5: Specify Output Format"""
-    
-    demonstrate_technique(
-        "TECHNIQUE 5: OUTPUT FORMAT",
-        [
-            "Tell me the benefits of exercise",
-            "Tell me the benefits of exercise. Format your response as a bulleted list with 5 items. Each bullet should be one sentence."
-        ],
-        [
-            "Free-form response",
-            "Structured format - Easy to scan"
-        ]
-    )
-
-
-def technique_6_constraints():
-    """Technique 6: Add Constraints"""
-    
-    demonstrate_technique(
-        "TECHNIQUE 6: CONSTRAINTS",
-        [
-            "Write a poem about programming",
-            "Write a poem about programming in exactly 8 lines. Each line should be about web development, and it should rhyme (AABB pattern)."
-        ],
-        [
-            "Open-ended",
-            "With constraints - More focused"
-        ]
-    )
-
-
-def technique_7_chain_of_thought():
-    """Technique 7: Chain of Thought"""
-    
-    demonstrate_technique(
-        "TECHNIQUE 7: CHAIN OF THOUGHT",
-        [
-            "Solve: If I have 3 apples and I buy 5 more, then give away 2, how many do I have?",
-            "Solve this step by step: If I have 3 apples and I buy 5 more, then give away 2, how many do I have? Show your work for each step."
-        ],
-        [
-            "Direct answer",
-            "Chain of thought - Shows reasoning"
-        ]
-    )
-
-
-def technique_8_negative_instructions():
-    """Technique 8: Negative Instructions (What NOT to do)"""
-    
-    demonstrate_technique(
-        "TECHNIQUE 8: NEGATIVE INSTRUCTIONS",
-        [
-            "Explain blockchain",
-            "Explain blockchain technology. Do NOT use technical jargon. Do NOT talk about cryptocurrency. Keep it simple and beginner-friendly."
-        ],
-        [
-            "Likely technical explanation",
-            "Constrained to be beginner-friendly"
-        ]
-    )
+# Every technique's (title, prompts, descriptions), built once at import
+# so main() can batch all prompts into a single concurrent fetch
+TECHNIQUES = (
+    ("TECHNIQUE 1: SPECIFICITY",
+     ("Tell me about Python",
+      "Write a Python function to calculate the factorial of a number. Include comments explaining each step."),
+     ("Vague - Generic answer",
+      "Specific - Detailed, actionable answer")),
+    ("TECHNIQUE 2: ROLE-PLAYING",
+     ("Explain quantum computing",
+      "You are a physics professor. Explain quantum computing to a high school student using everyday analogies."),
+     ("No context - Technical explanation",
+      "With role-playing - Tailored to audience")),
+    ("TECHNIQUE 3: PROVIDE EXAMPLES",
+     ("How do I use list comprehensions in Python?",
+      "How do I use list comprehensions in Python? Here's an example: squares = [x**2 for x in range(5)]. Can you give me 2 more practical examples?"),
+     ("Generic explanation",
+      "With examples - More concrete and helpful")),
+    ("TECHNIQUE 4: STEP-BY-STEP",
+     ("Is the sum of the angles in a triangle always 180 degrees?",
+      "Let me think through this step by step. In a triangle, we have three angles. What geometric principles determine the total angle measure? Can you walk me through the proof that they sum to 180 degrees?"),
+     ("Simple yes/no",
+      "Step-by-step reasoning")),
+    ("TECHNIQUE 5: OUTPUT FORMAT",
+     ("Tell me the benefits of exercise",
+      "Tell me the benefits of exercise. Format your response as a bulleted list with 5 items. Each bullet should be one sentence."),
+     ("Free-form response",
+      "Structured format - Easy to scan")),
+    ("TECHNIQUE 6: CONSTRAINTS",
+     ("Write a poem about programming",
+      "Write a poem about programming in exactly 8 lines. Each line should be about web development, and it should rhyme (AABB pattern)."),
+     ("Open-ended",
+      "With constraints - More focused")),
+    ("TECHNIQUE 7: CHAIN OF THOUGHT",
+     ("Solve: If I have 3 apples and I buy 5 more, then give away 2, how many do I have?",
+      "Solve this step by step: If I have 3 apples and I buy 5 more, then give away 2, how many do I have? Show your work for each step."),
+     ("Direct answer",
+      "Chain of thought - Shows reasoning")),
+    ("TECHNIQUE 8: NEGATIVE INSTRUCTIONS",
+     ("Explain blockchain",
+      "Explain blockchain technology. Do NOT use technical jargon. Do NOT talk about cryptocurrency. Keep it simple and beginner-friendly."),
+     ("Likely technical explanation",
+      "Constrained to be beginner-friendly")),
+)
+
+
+def run_all_techniques():
+    """Fetch every technique's prompts in one concurrent batch, then print."""
+
+    all_prompts = [prompt for _, prompts, _ in TECHNIQUES for prompt in prompts]
+    responses = fetch_responses(all_prompts, max_chars=300, num_predict=80)
+
+    i = 0
+    for title, prompts, descriptions in TECHNIQUES:
+        demonstrate_technique(title, prompts, descriptions,
+                              responses=responses[i:i + len(prompts)])
+        i += len(prompts)
 
 
 def advanced_prompt_examples():
     """Show advanced prompt engineering patterns."""
     
-    print(f"\n{'=' * 70}")
+    print(f"\n{BAR70}")
     print("🚀 ADVANCED PATTERNS")
-    print(f"{'=' * 70}\n")
+    print(f"{BAR70}\n")
     
     advanced_prompts = {
         "Few-Shot Learning": {
@@ -220,12 +227,17 @@ This prompt is too vague. Can you suggest a better, more specific version of thi
         }
     }
     
-    for name, data in advanced_prompts.items():
+    # The three patterns are independent, so fetch them concurrently
+    # like the technique demos and print in the original order
+    responses = fetch_responses(
+        [data["prompt"] for data in advanced_prompts.values()],
+        max_chars=250, num_predict=80)
+
+    for (name, data), response in zip(advanced_prompts.items(), responses):
         print(f"📌 {name}")
         print(f"Description: {data['description']}")
         print(f"Prompt: {data['prompt']}")
-        print("-" * 70)
-        response = ask_model(data['prompt'])
+        print(DASH70)
         preview = response[:250] + "..." if len(response) > 250 else response
         print(f"Response: {preview}\n")
 
@@ -233,9 +245,9 @@ This prompt is too vague. Can you suggest a better, more specific version of thi
 def tips_and_best_practices():
     """Print tips for effective prompting."""
     
-    print(f"\n{'=' * 70}")
+    print(f"\n{BAR70}")
     print("💡 TIPS & BEST PRACTICES")
-    print(f"{'=' * 70}\n")
+    print(f"{BAR70}\n")
     
     tips = [
         ("Be Clear & Specific", "The more specific your prompt, the better the response."),
@@ -258,20 +270,12 @@ def tips_and_best_practices():
 def main():
     """Run all examples."""
     
-    print("\n" + "=" * 70)
-    print("PROMPT ENGINEERING GUIDE")
-    print("=" * 70)
-    print("\nThis guide shows different techniques to improve your prompts.\n")
+    # One print per banner block: a single write() instead of four
+    print(f"\n{BAR70}\nPROMPT ENGINEERING GUIDE\n{BAR70}\n"
+          "\nThis guide shows different techniques to improve your prompts.\n")
     
-    # Run techniques
-    technique_1_specificity()
-    technique_2_role_playing()
-    technique_3_examples()
-    technique_4_step_by_step()
-    technique_5_output_format()
-    technique_6_constraints()
-    technique_7_chain_of_thought()
-    technique_8_negative_instructions()
+    # Run techniques (all prompts fetched in one concurrent batch)
+    run_all_techniques()
     
     # Show advanced patterns
     advanced_prompt_examples()
@@ -279,8 +283,7 @@ def main():
     # Show tips
     tips_and_best_practices()
     
-    print("=" * 70)
-    print("\n✅ End of Prompt Engineering Guide\n")
+    print(f"{BAR70}\n\n✅ End of Prompt Engineering Guide\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+"""
+Persistent Response Cache
+==========================
+Small SQLite-backed cache for LLM responses, shared by the example scripts.
+Re-running a demo with identical (model, prompt, parameters) serves the
+answer from disk instead of re-running the generation.
+
+Only near-deterministic requests (temperature <= 0.3) are cached;
+higher temperatures are expected to vary between calls, so caching
+them would freeze one random sample forever.
+
+Optionally (OLLAMA_SEMANTIC_CACHE=1), lookups that miss the exact-match
+table fall back to a semantic search: prompts are embedded via Ollama's
+own embeddings endpoint and compared by cosine similarity, so a
+rephrased prompt can still hit the cache.
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import time
+
+import requests
+
+# Cache file lives next to wherever the scripts are run from
+CACHE_PATH = ".ollama_cache.db"
+CACHE_TTL = 7 * 24 * 3600  # seven days
+MAX_CACHE_TEMPERATURE = 0.3
+
+# Semantic lookup (opt-in): embeddings come from Ollama itself, so it
+# needs `ollama pull nomic-embed-text` and the server running
+SEMANTIC_CACHE = os.getenv("OLLAMA_SEMANTIC_CACHE") == "1"
+EMBED_URL = "http://localhost:11434/api/embeddings"
+EMBED_MODEL = "nomic-embed-text"
+SEMANTIC_THRESHOLD = 0.92
+
+
+def _connect():
+    """Open the cache database, creating the table on first use."""
+    conn = sqlite3.connect(CACHE_PATH, timeout=5.0)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, response TEXT, created REAL)"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS vectors ("
+        "key TEXT PRIMARY KEY, model TEXT, vector TEXT)"
+    )
+    return conn
+
+
+def _make_key(model, prompt, params):
+    """Hash (model, prompt, sorted params) into a stable cache key."""
+    blob = json.dumps({"m": model, "p": prompt, "params": params},
+                      sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def _cacheable(params):
+    """Only cache near-deterministic requests."""
+    return params.get("temperature", 1.0) <= MAX_CACHE_TEMPERATURE
+
+
+def _embed(prompt):
+    """Embed a prompt via Ollama's embeddings endpoint (None on failure)."""
+    try:
+        response = requests.post(EMBED_URL, json={
+            "model": EMBED_MODEL,
+            "prompt": prompt
+        }, timeout=5.0)
+        response.raise_for_status()
+        return response.json().get("embedding") or None
+    except (requests.exceptions.RequestException, ValueError):
+        return None
+
+
+def _cosine(a, b):
+    """Cosine similarity between two vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def _semantic_lookup(model, prompt):
+    """
+    Find a cached response whose prompt is semantically near this one.
+
+    Scans the stored embedding vectors for the same model and returns
+    the best match above SEMANTIC_THRESHOLD, so rephrasings of an
+    already-answered prompt hit the cache too.
+    """
+    vector = _embed(prompt)
+    if vector is None:
+        return None
+
+    try:
+        with _connect() as conn:
+            rows = conn.execute(
+                "SELECT key, vector FROM vectors WHERE model = ?",
+                (model,)
+            ).fetchall()
+
+            best_key, best_score = None, SEMANTIC_THRESHOLD
+            for key, stored in rows:
+                score = _cosine(vector, json.loads(stored))
+                if score >= best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                return None
+
+            row = conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?",
+                (best_key,)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+
+    if row is None or time.time() - row[1] > CACHE_TTL:
+        return None
+    return row[0]
+
+
+def lookup(model, prompt, params=None):
+    """
+    Return the cached response for this request, or None on a miss.
+
+    Args:
+        model (str): Model name
+        prompt (str): The prompt
+        params (dict): Generation parameters (temperature etc.)
+
+    Returns:
+        str or None: The cached response text
+    """
+    params = params or {}
+    if not _cacheable(params):
+        return None
+
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?",
+                (_make_key(model, prompt, params),)
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+
+    if row is not None and time.time() - row[1] <= CACHE_TTL:
+        return row[0]
+
+    if SEMANTIC_CACHE:
+        return _semantic_lookup(model, prompt)
+    return None
+
+
+def store(model, prompt, params, response):
+    """Save a successful response (no-op for non-cacheable requests)."""
+    params = params or {}
+    if not _cacheable(params) or not response:
+        return
+
+    key = _make_key(model, prompt, params)
+    vector = _embed(prompt) if SEMANTIC_CACHE else None
+
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created) "
+                "VALUES (?, ?, ?)",
+                (key, response, time.time())
+            )
+            if vector is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO vectors (key, model, vector) "
+                    "VALUES (?, ?, ?)",
+                    (key, model, json.dumps(vector))
+                )
+    except sqlite3.Error:
+        pass